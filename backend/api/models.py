@@ -5,13 +5,20 @@ from django.db import models
 class Item(models.Model):
     title = models.CharField(max_length=200)
     description = models.TextField(blank=True)
-    owner = models.ForeignKey(User, on_delete=models.CASCADE)
+    # Indexed by the (owner, -created_at) index below
+    owner = models.ForeignKey(User, on_delete=models.CASCADE, db_index=False)
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["-created_at"], name="item_created_at_idx"),
+            models.Index(
+                fields=["owner", "-created_at"], name="item_owner_created_at_idx"
+            ),
+        ]
 
     def __str__(self):
         return self.title
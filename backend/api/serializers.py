@@ -1,25 +1,98 @@
-from django.contrib.auth.models import User
+import copy
 
 from rest_framework import serializers
 
 from .models import Item
 
 
-class UserSerializer(serializers.ModelSerializer):
-    class Meta:
-        model = User
-        fields = ["id", "username", "email"]
+class CachedFieldsModelSerializer(serializers.ModelSerializer):
+    """
+    ModelSerializer that builds its field template once per class.
+
+    DRF rebuilds and deep-copies every field for each serializer instance.
+    Fields only depend on the class, so the template is cached and each
+    instance receives shallow copies that are then bound independently.
+    Nested serializers carry their own bound fields (and ``ListSerializer``
+    its ``child``), so those are still deep-copied.
+    """
+
+    _fields_cache = {}
+
+    def get_fields(self):
+        cls = self.__class__
+        try:
+            template = self._fields_cache[cls]
+        except KeyError:
+            template = self._fields_cache[cls] = super().get_fields()
+        return {
+            name: (
+                copy.deepcopy(field)
+                if isinstance(field, serializers.BaseSerializer)
+                else copy.copy(field)
+            )
+            for name, field in template.items()
+        }
+
+
+class EagerLoadingMixin:
+    """
+    Apply the relations a serializer reads to the queryset it will render.
+
+    Serializers list the relations they traverse in ``Meta.select_related``
+    and ``Meta.prefetch_related`` so views don't have to repeat them. An
+    optional ``Meta.only`` restricts the selected columns to those rendered.
+    """
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        meta = cls.Meta
+        queryset = queryset.select_related(
+            *getattr(meta, "select_related", ())
+        ).prefetch_related(*getattr(meta, "prefetch_related", ()))
+
+        only = getattr(meta, "only", None)
+        if only:
+            queryset = queryset.only(*only)
+
+        return queryset
+
+
+# Item columns and owner columns rendered by ItemSerializer. The serializer's
+# fields, its ``Meta.only`` and the list view's ``values()`` all derive from
+# these, so they can't drift apart.
+ITEM_COLUMNS = (
+    "id",
+    "title",
+    "description",
+    "is_active",
+    "created_at",
+    "updated_at",
+)
+ITEM_OWNER_COLUMNS = ("username", "email")
 
 
-class ItemSerializer(serializers.ModelSerializer):
-    owner = UserSerializer(read_only=True)
+class ItemSerializer(EagerLoadingMixin, CachedFieldsModelSerializer):
+    owner_id = serializers.IntegerField(read_only=True)
+    owner_username = serializers.CharField(source="owner.username", read_only=True)
+    owner_email = serializers.EmailField(source="owner.email", read_only=True)
 
     class Meta:
         model = Item
-        fields = "__all__"
+        fields = [
+            *ITEM_COLUMNS,
+            "owner_id",
+            *(f"owner_{column}" for column in ITEM_OWNER_COLUMNS),
+        ]
+        select_related = ["owner"]
+        prefetch_related = []
+        only = [
+            *ITEM_COLUMNS,
+            "owner__id",
+            *(f"owner__{column}" for column in ITEM_OWNER_COLUMNS),
+        ]
 
 
-class ItemCreateSerializer(serializers.ModelSerializer):
+class ItemCreateSerializer(CachedFieldsModelSerializer):
     class Meta:
         model = Item
         fields = ["title", "description"]
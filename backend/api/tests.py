@@ -1,19 +1,34 @@
+import json
+
 from django.contrib.auth.models import User
 from django.test import TestCase
 
 from rest_framework import status
+from rest_framework.renderers import JSONRenderer
 from rest_framework.test import APIClient
 
 from .models import Item
+from .serializers import CachedFieldsModelSerializer, ItemSerializer
+
+
+class OwnerWithItemsSerializer(CachedFieldsModelSerializer):
+    """Serializer with nested fields, used to exercise the field cache."""
+
+    items = ItemSerializer(source="item_set", many=True, read_only=True)
+
+    class Meta:
+        model = User
+        fields = ["id", "username", "items"]
 
 
 class ItemModelTest(TestCase):
     """Test the Item model."""
 
-    def setUp(self):
-        """Set up test data."""
-        self.user = User.objects.create_user(
-            username="testuser", email="test@example.com", password="testpass123"
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test in the class."""
+        cls.user = User.objects.create_user(
+            username="testuser", email="test@example.com"
         )
 
     def test_item_creation(self):
@@ -39,11 +54,11 @@ class ItemModelTest(TestCase):
 
     def test_item_ordering(self):
         """Test that items are ordered by creation date (newest first)."""
-        item1 = Item.objects.create(
-            title="First Item", description="First", owner=self.user
-        )
-        item2 = Item.objects.create(
-            title="Second Item", description="Second", owner=self.user
+        item1, item2 = Item.objects.bulk_create(
+            [
+                Item(title="First Item", description="First", owner=self.user),
+                Item(title="Second Item", description="Second", owner=self.user),
+            ]
         )
 
         items = Item.objects.all()
@@ -51,22 +66,76 @@ class ItemModelTest(TestCase):
         self.assertEqual(items[1], item1)  # Oldest last
 
 
+class ItemSerializerTest(TestCase):
+    """Test the Item serializer."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test in the class."""
+        cls.user = User.objects.create_user(
+            username="testuser", email="test@example.com"
+        )
+        cls.item = Item.objects.create(title="Test Item", owner=cls.user)
+
+    def test_instances_do_not_share_fields(self):
+        """Test that cached field templates are copied per instance."""
+        first = ItemSerializer(self.item)
+        second = ItemSerializer(self.item)
+        self.assertIsNot(first.fields["title"], second.fields["title"])
+        self.assertIs(first.fields["title"].parent, first)
+        self.assertIs(second.fields["title"].parent, second)
+
+    def test_instances_do_not_share_nested_fields(self):
+        """Test that nested serializer fields are deep-copied per instance."""
+        first = OwnerWithItemsSerializer(self.user)
+        second = OwnerWithItemsSerializer(self.user)
+        self.assertIsNot(first.fields["items"], second.fields["items"])
+        first_child = first.fields["items"].child
+        second_child = second.fields["items"].child
+        self.assertIsNot(first_child, second_child)
+        self.assertIs(first_child.parent, first.fields["items"])
+        self.assertIs(second_child.parent, second.fields["items"])
+        self.assertIsNot(first_child.fields["title"], second_child.fields["title"])
+
+    def test_serialized_nested_data(self):
+        """Test that nested serializers render from the cached template."""
+        for _ in range(2):
+            data = OwnerWithItemsSerializer(self.user).data
+            self.assertEqual(data["items"][0]["title"], "Test Item")
+            self.assertEqual(data["items"][0]["owner_username"], "testuser")
+
+    def test_serialized_data(self):
+        """Test that serialized data flattens the owner fields."""
+        data = ItemSerializer(self.item).data
+        self.assertEqual(data["title"], "Test Item")
+        self.assertEqual(data["owner_id"], self.user.id)
+        self.assertEqual(data["owner_username"], "testuser")
+        self.assertEqual(data["owner_email"], "test@example.com")
+        self.assertNotIn("owner", data)
+
+
 class ItemAPITest(TestCase):
     """Test the Item API endpoints."""
 
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test in the class."""
+        cls.user = User.objects.create_user(
+            username="testuser", email="test@example.com"
+        )
+
     def setUp(self):
-        """Set up test data."""
+        """Set up the authenticated client."""
         self.client = APIClient()
-        self.user = User.objects.create_user(
-            username="testuser", email="test@example.com", password="testpass123"
-        )
         self.client.force_authenticate(user=self.user)
 
     def test_item_list_requires_authentication(self):
         """Test that item list requires authentication."""
         # Create unauthenticated client
         client = APIClient()
-        response = client.get("/api/items/")
+        # Rejected before any session or database lookup
+        with self.assertNumQueries(0):
+            response = client.get("/api/items/")
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
     def test_item_list_with_authentication(self):
@@ -74,6 +143,46 @@ class ItemAPITest(TestCase):
         response = self.client.get("/api/items/")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    def test_item_list_only_includes_own_items(self):
+        """Test that users only see the items they own."""
+        other = User.objects.create_user(username="other", email="other@example.com")
+        Item.objects.create(title="Other Item", owner=other)
+        Item.objects.create(title="My Item", owner=self.user)
+
+        response = self.client.get("/api/items/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        titles = [item["title"] for item in response.data["results"]]
+        self.assertEqual(titles, ["My Item"])
+
+    def test_item_list_fetches_owners_in_single_query(self):
+        """Test that staff see all owners' items, joined in one query."""
+        self.user.is_staff = True
+        self.user.save()
+        for i in range(3):
+            owner = User.objects.create_user(
+                username=f"owner{i}", email=f"owner{i}@example.com"
+            )
+            Item.objects.create(title=f"Item {i}", owner=owner)
+
+        # One COUNT query for pagination plus one joined SELECT
+        with self.assertNumQueries(2):
+            response = self.client.get("/api/items/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 3)
+
+    def test_item_list_matches_serializer_output(self):
+        """Test that list rows have the same shape as serialized items."""
+        item = Item.objects.create(
+            title="Test Item",
+            description="This is a test item",
+            owner=self.user,
+        )
+        response = self.client.get("/api/items/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        expected = json.loads(JSONRenderer().render(ItemSerializer(item).data))
+        self.assertEqual(response.json()["results"], [expected])
+
     def test_create_item(self):
         """Test creating a new item."""
         data = {
@@ -99,6 +208,43 @@ class ItemAPITest(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["title"], "Test Item")
 
+    def test_item_detail_hides_other_users_items(self):
+        """Test users can't read, update or delete items they don't own."""
+        other = User.objects.create_user(username="other", email="other@example.com")
+        item = Item.objects.create(title="Other Item", owner=other)
+        url = f"/api/items/{item.id}/"
+
+        for method, args in (
+            (self.client.get, ()),
+            (self.client.put, ({"title": "Mine now", "description": ""},)),
+            (self.client.delete, ()),
+        ):
+            with self.subTest(method=method.__name__):
+                response = method(url, *args)
+                self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        item.refresh_from_db()
+        self.assertEqual(item.title, "Other Item")
+
+    def test_item_detail_visible_to_staff(self):
+        """Test staff can access any user's item."""
+        self.user.is_staff = True
+        self.user.save()
+        other = User.objects.create_user(username="other", email="other@example.com")
+        item = Item.objects.create(title="Other Item", owner=other)
+
+        response = self.client.get(f"/api/items/{item.id}/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["owner_username"], "other")
+
+    def test_item_detail_loads_no_deferred_fields(self):
+        """Test that the projected detail query covers every rendered field."""
+        item = Item.objects.create(title="Test Item", owner=self.user)
+        with self.assertNumQueries(1):
+            response = self.client.get(f"/api/items/{item.id}/")
+        self.assertEqual(response.data["owner_email"], "test@example.com")
+
     def test_update_item(self):
         """Test updating an item."""
         item = Item.objects.create(
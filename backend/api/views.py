@@ -1,20 +1,58 @@
+from django.db.models import F
+
 from rest_framework import generics
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
 
 from .models import Item
-from .serializers import ItemSerializer
+from .serializers import ITEM_COLUMNS, ITEM_OWNER_COLUMNS, ItemSerializer
+
+
+class OwnedItemsMixin:
+    """Limit non-staff users to the items they own"""
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+
+        # Staff see every item; everyone else only sees their own
+        if not self.request.user.is_staff:
+            queryset = queryset.filter(owner=self.request.user)
 
+        return queryset
 
-class ItemList(generics.ListCreateAPIView):
+
+class ItemList(OwnedItemsMixin, generics.ListCreateAPIView):
     queryset = Item.objects.all()
     serializer_class = ItemSerializer
     permission_classes = [IsAuthenticated]
 
+    def list(self, request, *args, **kwargs):
+        # Read-only rows don't need the serializer: fetch them as plain dicts,
+        # joining the owner columns in the same query
+        queryset = self.filter_queryset(self.get_queryset()).values(
+            *ITEM_COLUMNS,
+            "owner_id",
+            **{
+                f"owner_{column}": F(f"owner__{column}")
+                for column in ITEM_OWNER_COLUMNS
+            },
+        )
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(page)
+
+        return Response(list(queryset))
+
     def perform_create(self, serializer):
         serializer.save(owner=self.request.user)
 
 
-class ItemDetail(generics.RetrieveUpdateDestroyAPIView):
+class ItemDetail(OwnedItemsMixin, generics.RetrieveUpdateDestroyAPIView):
     queryset = Item.objects.all()
     serializer_class = ItemSerializer
     permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        serializer_class = self.get_serializer_class()
+        return serializer_class.setup_eager_loading(super().get_queryset())
@@ -86,6 +86,9 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",
+        # Reuse connections across requests instead of reconnecting each time
+        "CONN_MAX_AGE": config("DB_CONN_MAX_AGE", default=600, cast=int),
+        "CONN_HEALTH_CHECKS": True,
     }
 }
 
@@ -107,6 +110,23 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Threads each worker process may use to hash passwords in bulk (admin user
+# import); keep workers x threads at or below the host's cores
+PASSWORD_HASH_THREADS = config("PASSWORD_HASH_THREADS", default=2, cast=int)
+
+# Authentication backends
+AUTHENTICATION_BACKENDS = ["users.backends.LoginModelBackend"]
+
+# Password hashing; the remaining hashers verify (and upgrade on login)
+# passwords stored before Argon2 was the default
+PASSWORD_HASHERS = [
+    "users.hashers.TunedArgon2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+
 # Internationalization
 LANGUAGE_CODE = "en-us"
 TIME_ZONE = "UTC"
@@ -122,14 +142,45 @@ MEDIA_ROOT = BASE_DIR / "media"
 # Default primary key field type
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# Cache; the JWT user cache and the login throttle must be shared by every
+# worker process, so deployments set REDIS_URL. Without it (e.g. the
+# single-process dev server) a per-process memory cache is used. Django's
+# RedisCache passes OPTIONS through to redis-py's connection pool; redis-py
+# parses replies with hiredis (C) whenever it is installed.
+REDIS_URL = config("REDIS_URL", default="")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+            "OPTIONS": {
+                "max_connections": config(
+                    "REDIS_MAX_CONNECTIONS", default=100, cast=int
+                ),
+                "socket_keepalive": True,
+            },
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
 # REST Framework settings
 REST_FRAMEWORK = {
-    "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
-    ),
+    "DEFAULT_AUTHENTICATION_CLASSES": ("users.authentication.CachedJWTAuthentication",),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 10,
+    "DEFAULT_THROTTLE_RATES": {
+        "login": config("LOGIN_THROTTLE_RATE", default="10/min"),
+        "login_email": config("LOGIN_EMAIL_THROTTLE_RATE", default="5/min"),
+    },
+    # Reverse proxies in front of the app; 0 ignores X-Forwarded-For, which
+    # is client-controlled when the app is reached directly
+    "NUM_PROXIES": config("NUM_PROXIES", default=0, cast=int),
 }
 
 # CORS settings
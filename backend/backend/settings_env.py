@@ -9,6 +9,10 @@ from pathlib import Path
 
 from decouple import Csv, config
 
+# Shared with the base settings, which define them once
+from .settings import CACHES  # noqa: F401
+from .settings import DATABASES as _BASE_DATABASES
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -33,12 +37,12 @@ DATABASES = {
         "PASSWORD": config("POSTGRES_PASSWORD", default="postgres"),
         "HOST": config("POSTGRES_HOST", default="localhost"),
         "PORT": config("POSTGRES_PORT", default="5432", cast=int),
+        # Connection reuse is configured once, in the base settings
+        "CONN_MAX_AGE": _BASE_DATABASES["default"]["CONN_MAX_AGE"],
+        "CONN_HEALTH_CHECKS": _BASE_DATABASES["default"]["CONN_HEALTH_CHECKS"],
     }
 }
 
-# Redis configuration
-REDIS_URL = config("REDIS_URL", default="redis://localhost:6379/0")
-
 # CORS configuration
 CORS_ALLOWED_ORIGINS = config(
     "CORS_ALLOWED_ORIGINS",
@@ -130,17 +134,6 @@ if LOG_FILE:
     }
     LOGGING["root"]["handlers"].append("file")
 
-# Cache configuration
-CACHES = {
-    "default": {
-        "BACKEND": "django.core.cache.backends.redis.RedisCache",
-        "LOCATION": REDIS_URL,
-        "OPTIONS": {
-            "CLIENT_CLASS": "django_redis.client.DefaultClient",
-        },
-    }
-}
-
 # Session configuration
 SESSION_ENGINE = "django.contrib.sessions.backends.cache"
 SESSION_CACHE_ALIAS = "default"
@@ -0,0 +1,21 @@
+"""
+Test settings for Plockly v2 backend.
+
+Extends the base settings with overrides that only make sense when running
+the test suite.
+"""
+
+from .settings import *  # noqa: F401,F403
+
+# Password hashing is deliberately slow; tests don't need it to be secure
+PASSWORD_HASHERS = [
+    "django.contrib.auth.hashers.MD5PasswordHasher",
+]
+
+# Rolled-back tests reuse user ids, so a shared cache would leak stale users
+# between tests; tests that exercise caching opt back in with override_settings
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.dummy.DummyCache",
+    }
+}
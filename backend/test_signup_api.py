@@ -9,6 +9,9 @@ import requests
 # API endpoint
 SIGNUP_URL = "http://localhost:8000/api/auth/signup/"
 
+# Shared session so every request reuses one keep-alive connection
+SESSION = requests.Session()
+
 
 def test_signup_success():
     """Test successful user signup"""
@@ -20,7 +23,7 @@ def test_signup_success():
         "password_confirm": "TestPass123!",
     }
 
-    response = requests.post(SIGNUP_URL, json=data)
+    response = SESSION.post(SIGNUP_URL, json=data)
 
     print(f"Status Code: {response.status_code}")
     if response.status_code == 201:
@@ -47,7 +50,7 @@ def test_signup_duplicate_email():
         "password_confirm": "AnotherPass123!",
     }
 
-    response = requests.post(SIGNUP_URL, json=data)
+    response = SESSION.post(SIGNUP_URL, json=data)
 
     print(f"Status Code: {response.status_code}")
     if response.status_code == 400:
@@ -71,7 +74,7 @@ def test_signup_password_mismatch():
         "password_confirm": "DifferentPass123!",
     }
 
-    response = requests.post(SIGNUP_URL, json=data)
+    response = SESSION.post(SIGNUP_URL, json=data)
 
     print(f"Status Code: {response.status_code}")
     if response.status_code == 400:
@@ -95,7 +98,7 @@ def test_signup_weak_password():
         "password_confirm": "123",
     }
 
-    response = requests.post(SIGNUP_URL, json=data)
+    response = SESSION.post(SIGNUP_URL, json=data)
 
     print(f"Status Code: {response.status_code}")
     if response.status_code == 400:
@@ -119,7 +122,7 @@ def test_signup_invalid_email():
         "password_confirm": "TestPass123!",
     }
 
-    response = requests.post(SIGNUP_URL, json=data)
+    response = SESSION.post(SIGNUP_URL, json=data)
 
     print(f"Status Code: {response.status_code}")
     if response.status_code == 400:
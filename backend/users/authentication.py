@@ -0,0 +1,72 @@
+"""
+JWT authentication backed by a short-lived cache of user rows.
+
+Every JWT-authenticated request otherwise runs a ``SELECT`` on ``auth_user``
+to resolve ``request.user``. The user's fields (minus the password hash) are
+cached by id instead, and rebuilt into a ``User`` instance whose uncached
+fields are deferred, so saving it never overwrites them.
+
+Entries are dropped on ``post_save``/``post_delete``, which only reaches
+every worker when the cache is shared (Redis via ``REDIS_URL``). Writes
+that skip signals, such as ``QuerySet.update()``, are picked up when the
+entry expires after ``USER_CACHE_TIMEOUT`` seconds.
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+
+User = get_user_model()
+
+USER_CACHE_TIMEOUT = 300
+
+# Never cache credentials; last_login changes on every login anyway
+_CACHED_FIELDS = tuple(
+    field.attname
+    for field in User._meta.concrete_fields
+    if field.attname not in ("password", "last_login")
+)
+
+
+def user_cache_key(user_id):
+    return f"user:{user_id}"
+
+
+def invalidate_cached_user(sender, instance, **kwargs):
+    """Drop a user's cached row whenever it is saved or deleted"""
+    cache.delete(user_cache_key(getattr(instance, api_settings.USER_ID_FIELD)))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """JWTAuthentication that resolves the token's user from the cache"""
+
+    def get_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+
+        # The revoke check needs the password hash, which is never cached
+        if user_id is None or api_settings.CHECK_REVOKE_TOKEN:
+            return super().get_user(validated_token)
+
+        key = user_cache_key(user_id)
+        values = cache.get(key)
+
+        if values is None:
+            # Only active users get this far, so only they are cached
+            user = super().get_user(validated_token)
+            cache.set(
+                key,
+                [getattr(user, name) for name in _CACHED_FIELDS],
+                USER_CACHE_TIMEOUT,
+            )
+            return user
+
+        user = User.from_db(DEFAULT_DB_ALIAS, _CACHED_FIELDS, values)
+        if not user.is_active:
+            # Never authenticate from a cached inactive row; the database decides
+            cache.delete(key)
+            return super().get_user(validated_token)
+
+        return user
@@ -0,0 +1,36 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+UserModel = get_user_model()
+
+
+class LoginModelBackend(ModelBackend):
+    """
+    ModelBackend that loads only the columns login needs
+
+    ``authenticate()`` selects the credentials plus the fields the login
+    response renders; anything else is deferred and loaded on access.
+    ``get_user()`` (session auth, e.g. the admin) still loads full rows.
+    """
+
+    login_fields = ("id", "username", "email", "password", "is_active", "date_joined")
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+
+        try:
+            user = UserModel._default_manager.only(*self.login_fields).get(
+                **{UserModel.USERNAME_FIELD: username}
+            )
+        except UserModel.DoesNotExist:
+            # Run the default password hasher once to reduce the timing
+            # difference between an existing and a nonexistent user
+            UserModel().set_password(password)
+        else:
+            if user.check_password(password) and self.user_can_authenticate(user):
+                return user
+
+        return None
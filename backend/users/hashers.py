@@ -0,0 +1,19 @@
+"""
+Password hashers for the auth endpoints.
+"""
+
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2id with OWASP's minimum recommended cost
+
+    Login and signup hash a password on every request. Django's default
+    Argon2 parameters (100 MiB, 8 lanes) are far above that recommendation,
+    so each hash costs more CPU and memory than it needs to.
+    """
+
+    time_cost = 2
+    memory_cost = 19456  # KiB, i.e. 19 MiB
+    parallelism = 1
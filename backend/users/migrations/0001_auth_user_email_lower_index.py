@@ -0,0 +1,18 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX users_auth_user_email_lower_idx "
+                "ON auth_user (LOWER(email));"
+            ),
+            reverse_sql="DROP INDEX users_auth_user_email_lower_idx;",
+        ),
+    ]
@@ -0,0 +1,24 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0001_auth_user_email_lower_index"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=[
+                "DROP INDEX users_auth_user_email_lower_idx;",
+                # Users created without an email (e.g. via the admin) are exempt
+                "CREATE UNIQUE INDEX users_auth_user_email_lower_uniq "
+                "ON auth_user (LOWER(email)) WHERE email <> '';",
+            ],
+            reverse_sql=[
+                "DROP INDEX users_auth_user_email_lower_uniq;",
+                "CREATE INDEX users_auth_user_email_lower_idx "
+                "ON auth_user (LOWER(email));",
+            ],
+        ),
+    ]
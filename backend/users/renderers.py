@@ -0,0 +1,37 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# Falls back to DRF's encoder for types orjson doesn't know (lazy strings,
+# Decimal, timedelta, ...)
+_default = JSONEncoder().default
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that encodes with orjson
+
+    Produces the same bytes as DRF's renderer under the default settings
+    (compact, UTF-8, ``Z`` suffix for UTC datetimes, U+2028/U+2029 escaped).
+    Indented output, or non-default ``COMPACT_JSON``/``UNICODE_JSON``
+    settings, fall back to DRF's own encoding.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if indent is not None or not self.compact or self.ensure_ascii:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(
+            data,
+            default=_default,
+            option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+        )
+
+        # Valid JSON but not valid JavaScript, so DRF escapes them too
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
@@ -1,44 +1,80 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
-from django.contrib.auth.password_validation import validate_password
+from django.contrib.auth.password_validation import (
+    MinimumLengthValidator,
+    get_default_password_validators,
+    validate_password,
+)
 from django.core.exceptions import ValidationError
-from django.core.validators import EmailValidator
+from django.db import IntegrityError, transaction
 
 from rest_framework import serializers
 
+from api.serializers import CachedFieldsModelSerializer
+
+# Pool for hashing many passwords at once. The hashers run in C and release
+# the GIL, so threads hash in parallel across cores. Created on first use and
+# sized by PASSWORD_HASH_THREADS, which is per worker process.
+_hash_pool = None
+_hash_pool_lock = threading.Lock()
+
+
+def _get_hash_pool():
+    global _hash_pool
+
+    with _hash_pool_lock:
+        if _hash_pool is None:
+            _hash_pool = ThreadPoolExecutor(
+                max_workers=settings.PASSWORD_HASH_THREADS,
+                thread_name_prefix="password-hash",
+            )
+        return _hash_pool
+
+
+EMAIL_TAKEN_MESSAGE = "A user with this email already exists."
+
+
+class UserCredentialsSerializer(serializers.Serializer):
+    """Serializer for a new user's email and password"""
 
-class UserSignupSerializer(serializers.Serializer):
     email = serializers.EmailField(
         max_length=254,
-        validators=[EmailValidator()],
         help_text="User's email address (will also be used as username)",
     )
     password = serializers.CharField(
         max_length=128, write_only=True, help_text="User's password"
     )
-    password_confirm = serializers.CharField(
-        max_length=128, write_only=True, help_text="Password confirmation"
-    )
 
     def validate_email(self, value):
-        """Validate email format and uniqueness"""
-        # Normalize email (lowercase and trim whitespace)
-        email = value.lower().strip()
-
-        # Check if email already exists
-        if User.objects.filter(email=email).exists():
-            raise serializers.ValidationError("A user with this email already exists.")
-
-        return email
+        """Normalize email (uniqueness is enforced by the database)"""
+        # EmailField has already trimmed and format-checked the value
+        return value.lower()
 
     def validate_password(self, value):
         """Validate password strength"""
+        validators = get_default_password_validators()
         try:
-            validate_password(value)
+            # Reject short passwords before the costlier validators run
+            for validator in validators:
+                if isinstance(validator, MinimumLengthValidator):
+                    validator.validate(value)
+
+            validate_password(value, password_validators=validators)
         except ValidationError as e:
             raise serializers.ValidationError(e.messages)
 
         return value
 
+
+class UserSignupSerializer(UserCredentialsSerializer):
+    password_confirm = serializers.CharField(
+        max_length=128, write_only=True, help_text="Password confirmation"
+    )
+
     def validate(self, attrs):
         """Validate password confirmation"""
         password = attrs.get("password")
@@ -56,15 +92,61 @@ class UserSignupSerializer(serializers.Serializer):
         email = validated_data["email"]
         password = validated_data["password"]
 
-        # Create user with email as username
-        user = User.objects.create_user(
-            username=email, email=email, password=password, is_active=True
-        )
+        # Create user with email as username; the unique indexes on username
+        # and LOWER(email) reject duplicates without a separate lookup
+        try:
+            with transaction.atomic():
+                user = User.objects.create_user(
+                    username=email, email=email, password=password, is_active=True
+                )
+        except IntegrityError:
+            raise serializers.ValidationError({"email": [EMAIL_TAKEN_MESSAGE]})
 
         return user
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserBulkSignupSerializer(serializers.Serializer):
+    """Serializer for admin bulk user import"""
+
+    # Rows per INSERT; Django lowers this further if the backend requires it
+    BATCH_SIZE = 10_000
+
+    users = UserCredentialsSerializer(many=True, allow_empty=False)
+
+    def validate_users(self, value):
+        """Validate emails are unique within the import"""
+        emails = [user["email"] for user in value]
+        if len(set(emails)) != len(emails):
+            raise serializers.ValidationError("Emails must be unique.")
+
+        return value
+
+    def create(self, validated_data):
+        """Create all users with batched INSERTs"""
+        rows = validated_data["users"]
+
+        hashes = _get_hash_pool().map(make_password, [row["password"] for row in rows])
+
+        users = [
+            User(
+                username=row["email"],
+                email=row["email"],
+                password=password_hash,
+                is_active=True,
+            )
+            for row, password_hash in zip(rows, hashes)
+        ]
+
+        try:
+            with transaction.atomic():
+                return User.objects.bulk_create(users, batch_size=self.BATCH_SIZE)
+        except IntegrityError:
+            raise serializers.ValidationError(
+                {"users": ["One or more users with these emails already exist."]}
+            )
+
+
+class UserSerializer(CachedFieldsModelSerializer):
     """Serializer for user data (read-only, no sensitive information)"""
 
     class Meta:
@@ -79,8 +161,12 @@ class UserLoginSerializer(serializers.Serializer):
     email = serializers.EmailField()
     password = serializers.CharField(write_only=True)
 
+    def validate_email(self, value):
+        """Normalize email to match the lowercased username stored at signup"""
+        return value.lower()
 
-class UserProfileSerializer(serializers.ModelSerializer):
+
+class UserProfileSerializer(CachedFieldsModelSerializer):
     """Serializer for user profile updates"""
 
     class Meta:
@@ -95,3 +181,12 @@ class UserProfileSerializer(serializers.ModelSerializer):
             "date_joined",
         ]
         read_only_fields = ["id", "is_active", "date_joined"]
+
+    def validate_email(self, value):
+        """Normalize email and check it against the LOWER(email) unique index"""
+        value = value.lower()
+        others = User.objects.exclude(pk=getattr(self.instance, "pk", None))
+        if value and others.filter(email__iexact=value).exists():
+            raise serializers.ValidationError(EMAIL_TAKEN_MESSAGE)
+
+        return value
@@ -0,0 +1,66 @@
+import hashlib
+from collections.abc import Mapping
+
+from rest_framework.throttling import SimpleRateThrottle
+
+
+class LoginRateThrottle(SimpleRateThrottle):
+    """
+    Limit login attempts per client IP
+
+    Runs before the view body, so rejected attempts never reach
+    ``authenticate()`` and its password hash. The client IP comes from
+    ``REMOTE_ADDR`` unless ``NUM_PROXIES`` says which ``X-Forwarded-For``
+    entry was added by a trusted proxy.
+    """
+
+    scope = "login"
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {
+            "scope": self.scope,
+            "ident": self.get_ident(request),
+        }
+
+
+class LoginEmailRateThrottle(SimpleRateThrottle):
+    """
+    Limit failed login attempts per submitted email
+
+    Caps password guesses against one account however many addresses they
+    come from. Checking a request does not count it; the login view calls
+    ``record_failure()`` once ``authenticate()`` has rejected the password,
+    so successful logins never use up the account's bucket.
+    """
+
+    scope = "login_email"
+
+    def throttle_success(self):
+        # Only failures are recorded, by record_failure()
+        return True
+
+    def record_failure(self, request):
+        """Count a failed login against the submitted email's bucket"""
+        key = self.get_cache_key(request, None)
+        if key is None:
+            return
+
+        now = self.timer()
+        history = [
+            timestamp
+            for timestamp in self.cache.get(key, [])
+            if timestamp > now - self.duration
+        ]
+        history.insert(0, now)
+        self.cache.set(key, history, self.duration)
+
+    def get_cache_key(self, request, view):
+        data = request.data
+        email = data.get("email") if isinstance(data, Mapping) else None
+        if not isinstance(email, str) or not email.strip():
+            # Nothing to key on; the serializer rejects the request anyway
+            return None
+
+        # Normalized like UserLoginSerializer, and hashed to bound key length
+        ident = hashlib.sha256(email.strip().lower().encode()).hexdigest()
+        return self.cache_format % {"scope": self.scope, "ident": ident}
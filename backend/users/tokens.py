@@ -0,0 +1,244 @@
+"""
+JWT issuance and revocation for the auth endpoints.
+
+Mints the same refresh/access token pair as ``RefreshToken.for_user()``,
+but signs the claims directly with PyJWT using a signing key and algorithm
+resolved once at import time, instead of going through simplejwt's token
+classes and token backend on every call. For HMAC algorithms the header
+and keyed HMAC state are also prepared once and shared by both tokens.
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+from secrets import token_hex
+
+from django.db import IntegrityError, transaction
+
+import jwt
+import orjson
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+from rest_framework_simplejwt.utils import (
+    aware_utcnow,
+    datetime_from_epoch,
+    datetime_to_epoch,
+    get_md5_hash_password,
+)
+
+_ALGORITHM = api_settings.ALGORITHM
+
+# Keys are parsed once (e.g. PEM into RSA key objects) rather than by PyJWT
+# on every encode and decode
+_prepare_key = jwt.get_algorithm_by_name(_ALGORITHM).prepare_key
+_SIGNING_KEY = _prepare_key(api_settings.SIGNING_KEY)
+_VERIFYING_KEY = (
+    _SIGNING_KEY
+    if _ALGORITHM.startswith("HS")
+    else _prepare_key(api_settings.VERIFYING_KEY)
+)
+
+# Claims added to every token by simplejwt's TokenBackend, when configured
+_BASE_CLAIMS = {
+    claim: value
+    for claim, value in (("aud", api_settings.AUDIENCE), ("iss", api_settings.ISSUER))
+    if value is not None
+}
+
+# Claims of a refresh token that are not carried over to its access tokens
+_NO_COPY_CLAIMS = frozenset(
+    {api_settings.TOKEN_TYPE_CLAIM, "exp", api_settings.JTI_CLAIM}
+)
+
+_HMAC_DIGESTS = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}
+
+
+def _b64encode(data):
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+if _ALGORITHM in _HMAC_DIGESTS:
+    # Every token shares the same header, so it is serialized once, and the
+    # HMAC is keyed once and copied for each signature
+    _HEADER_B64 = _b64encode(
+        json.dumps(
+            {"alg": _ALGORITHM, "typ": "JWT"}, separators=(",", ":"), sort_keys=True
+        ).encode()
+    )
+    _HMAC = hmac.new(_SIGNING_KEY, digestmod=_HMAC_DIGESTS[_ALGORITHM])
+
+    def _dump_payload(payload):
+        # Claims are ints and ASCII strings, for which orjson's compact output
+        # matches json.dumps; a custom encoder still goes through json
+        if api_settings.JSON_ENCODER is None:
+            return orjson.dumps(payload)
+        return json.dumps(
+            payload, separators=(",", ":"), cls=api_settings.JSON_ENCODER
+        ).encode()
+
+    def _encode(payload):
+        signing_input = _HEADER_B64 + b"." + _b64encode(_dump_payload(payload))
+        mac = _HMAC.copy()
+        mac.update(signing_input)
+        return (signing_input + b"." + _b64encode(mac.digest())).decode()
+
+else:
+
+    def _encode(payload):
+        return jwt.encode(
+            payload,
+            _SIGNING_KEY,
+            algorithm=_ALGORITHM,
+            json_encoder=api_settings.JSON_ENCODER,
+        )
+
+
+def _new_jti():
+    # Same 32 hex characters as simplejwt's uuid4().hex, without building a
+    # UUID object
+    return token_hex(16)
+
+
+def tokens_for_user(user):
+    """
+    Return an ``(access, refresh)`` pair of encoded tokens for a user
+
+    The refresh token is recorded as outstanding, as simplejwt does, so it
+    can later be blacklisted.
+    """
+    now = aware_utcnow()
+    iat = datetime_to_epoch(now)
+    refresh_exp = datetime_to_epoch(now + api_settings.REFRESH_TOKEN_LIFETIME)
+    access_exp = datetime_to_epoch(now + api_settings.ACCESS_TOKEN_LIFETIME)
+
+    user_id = getattr(user, api_settings.USER_ID_FIELD)
+    if not isinstance(user_id, int):
+        user_id = str(user_id)
+
+    claims = {**_BASE_CLAIMS, "iat": iat, api_settings.USER_ID_CLAIM: user_id}
+    if api_settings.CHECK_REVOKE_TOKEN:
+        claims[api_settings.REVOKE_TOKEN_CLAIM] = get_md5_hash_password(user.password)
+
+    refresh_jti = _new_jti()
+    refresh = _encode(
+        {
+            api_settings.TOKEN_TYPE_CLAIM: "refresh",
+            "exp": refresh_exp,
+            api_settings.JTI_CLAIM: refresh_jti,
+            **claims,
+        }
+    )
+    access = _encode(
+        {
+            api_settings.TOKEN_TYPE_CLAIM: "access",
+            "exp": access_exp,
+            api_settings.JTI_CLAIM: _new_jti(),
+            **claims,
+        }
+    )
+
+    OutstandingToken.objects.create(
+        user=user,
+        jti=refresh_jti,
+        token=refresh,
+        created_at=now,
+        expires_at=datetime_from_epoch(refresh_exp),
+    )
+
+    return access, refresh
+
+
+def _decode_refresh_token(token):
+    """
+    Verify an encoded refresh token and return its payload
+
+    The token's signature, expiry and type are checked with PyJWT directly,
+    without building a ``RefreshToken``. Raises ``TokenError`` if the token
+    is invalid.
+    """
+    try:
+        payload = jwt.decode(
+            token,
+            _VERIFYING_KEY,
+            algorithms=[_ALGORITHM],
+            audience=api_settings.AUDIENCE,
+            issuer=api_settings.ISSUER,
+            leeway=api_settings.LEEWAY,
+            options={"verify_aud": api_settings.AUDIENCE is not None},
+        )
+    except jwt.InvalidTokenError as e:
+        raise TokenError("Token is invalid or expired") from e
+
+    if payload.get(api_settings.TOKEN_TYPE_CLAIM) != "refresh":
+        raise TokenError("Token has wrong type")
+    if api_settings.JTI_CLAIM not in payload:
+        raise TokenError("Token has no id")
+
+    return payload
+
+
+def access_token_for_refresh(token):
+    """
+    Return a new encoded access token for an encoded refresh token
+
+    The access token carries the refresh token's claims, as
+    ``RefreshToken.access_token`` does, so no user lookup is needed. Raises
+    ``TokenError`` if the refresh token is invalid or blacklisted.
+    """
+    payload = _decode_refresh_token(token)
+
+    if BlacklistedToken.objects.filter(
+        token__jti=payload[api_settings.JTI_CLAIM]
+    ).exists():
+        raise TokenError("Token is blacklisted")
+
+    now = aware_utcnow()
+    return _encode(
+        {
+            api_settings.TOKEN_TYPE_CLAIM: "access",
+            "exp": datetime_to_epoch(now + api_settings.ACCESS_TOKEN_LIFETIME),
+            api_settings.JTI_CLAIM: _new_jti(),
+            **{
+                claim: value
+                for claim, value in payload.items()
+                if claim not in _NO_COPY_CLAIMS
+            },
+        }
+    )
+
+
+def blacklist_refresh_token(token):
+    """
+    Blacklist an encoded refresh token
+
+    Raises ``TokenError`` if the token is invalid or has already been
+    blacklisted.
+    """
+    payload = _decode_refresh_token(token)
+
+    # Tokens from tokens_for_user() are already outstanding, so this is a
+    # single indexed lookup on jti
+    outstanding, _ = OutstandingToken.objects.get_or_create(
+        jti=payload[api_settings.JTI_CLAIM],
+        defaults={
+            "token": token,
+            "expires_at": datetime_from_epoch(payload["exp"]),
+        },
+    )
+
+    # The one-to-one on BlacklistedToken.token rejects a second blacklisting,
+    # so insert directly instead of looking the row up first
+    try:
+        with transaction.atomic():
+            BlacklistedToken.objects.create(token=outstanding)
+    except IntegrityError as e:
+        raise TokenError("Token is blacklisted") from e
@@ -1,21 +1,90 @@
-from django.contrib.auth import authenticate
+from collections.abc import Mapping
 
-from rest_framework import status
-from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from django.contrib.auth import authenticate
+from django.db import IntegrityError, transaction
+
+from rest_framework import serializers, status
+from rest_framework.decorators import (
+    api_view,
+    authentication_classes,
+    parser_classes,
+    permission_classes,
+    renderer_classes,
+    throttle_classes,
+)
+from rest_framework.parsers import FormParser, MultiPartParser
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
-from rest_framework_simplejwt.tokens import RefreshToken
 
+from .parsers import ORJSONParser
+from .renderers import ORJSONRenderer
 from .serializers import (
+    EMAIL_TAKEN_MESSAGE,
+    UserBulkSignupSerializer,
     UserLoginSerializer,
     UserProfileSerializer,
     UserSerializer,
     UserSignupSerializer,
 )
+from .throttling import LoginEmailRateThrottle, LoginRateThrottle
+from .tokens import (
+    access_token_for_refresh,
+    blacklist_refresh_token,
+    tokens_for_user,
+)
+
+
+def _user_dict(user):
+    """Render a user like UserSerializer, without building serializer fields"""
+    return {
+        "id": user.id,
+        "username": user.username,
+        "email": user.email,
+        "is_active": user.is_active,
+        "date_joined": user.date_joined,
+    }
+
+
+def _profile_dict(user):
+    """Render a user like UserProfileSerializer, without building its fields"""
+    return {
+        **_user_dict(user),
+        "first_name": user.first_name,
+        "last_name": user.last_name,
+    }
+
+
+# DRF's default parsers, with JSON decoded by orjson
+_TOKEN_PARSER_CLASSES = [ORJSONParser, FormParser, MultiPartParser]
+
+_WRITE_METHODS = frozenset({"PUT", "PATCH"})
+
+# Fields a profile update can change; anything else in the request is ignored
+_PROFILE_WRITABLE_FIELDS = frozenset(UserProfileSerializer.Meta.fields) - frozenset(
+    UserProfileSerializer.Meta.read_only_fields
+)
+
+
+def _build_auth_response(user, message, status_code):
+    """Build the user + JWT tokens response shared by signup and login"""
+    # Generate JWT tokens
+    access, refresh = tokens_for_user(user)
+    tokens = {"access": access, "refresh": refresh}
+
+    response_data = {
+        "user": _user_dict(user),
+        "tokens": tokens,
+        "message": message,
+    }
+
+    return Response(response_data, status=status_code)
 
 
 @api_view(["POST"])
+@authentication_classes([])
 @permission_classes([AllowAny])
+@parser_classes(_TOKEN_PARSER_CLASSES)
+@renderer_classes([ORJSONRenderer])
 def signup(request):
     """
     User signup endpoint
@@ -29,36 +98,51 @@ def signup(request):
         try:
             # Create the user
             user = serializer.save()
+        except serializers.ValidationError as e:
+            # The email unique constraint lost a race with another signup
+            return Response(e.detail, status=status.HTTP_400_BAD_REQUEST)
+
+        return _build_auth_response(
+            user, "User registered successfully!", status.HTTP_201_CREATED
+        )
+
+    return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-            # Generate JWT tokens
-            refresh = RefreshToken.for_user(user)
-            access_token = str(refresh.access_token)
-            refresh_token = str(refresh)
 
-            # Prepare response data
-            user_data = UserSerializer(user).data
-            tokens = {"access": access_token, "refresh": refresh_token}
+@api_view(["POST"])
+@permission_classes([IsAdminUser])
+def bulk_signup(request):
+    """
+    Bulk user import endpoint
 
-            response_data = {
-                "user": user_data,
-                "tokens": tokens,
-                "message": "User registered successfully!",
-            }
+    Requires: Admin authentication
+    Accepts: users (list of email, password)
+    Returns: created users' data, success message
+    """
+    serializer = UserBulkSignupSerializer(data=request.data)
 
-            return Response(response_data, status=status.HTTP_201_CREATED)
+    if serializer.is_valid():
+        try:
+            users = serializer.save()
+        except serializers.ValidationError as e:
+            return Response(e.detail, status=status.HTTP_400_BAD_REQUEST)
 
-        except Exception as e:
-            # If user creation fails, return error
-            return Response(
-                {"error": "Failed to create user. Please try again.", "detail": str(e)},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+        response_data = {
+            "users": UserSerializer(users, many=True).data,
+            "message": f"{len(users)} users imported successfully!",
+        }
+
+        return Response(response_data, status=status.HTTP_201_CREATED)
 
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
 @api_view(["POST"])
+@authentication_classes([])
 @permission_classes([AllowAny])
+@throttle_classes([LoginRateThrottle, LoginEmailRateThrottle])
+@parser_classes(_TOKEN_PARSER_CLASSES)
+@renderer_classes([ORJSONRenderer])
 def login(request):
     """
     User login endpoint
@@ -69,7 +153,7 @@ def login(request):
     serializer = UserLoginSerializer(data=request.data)
 
     if serializer.is_valid():
-        email = serializer.validated_data["email"].lower().strip()
+        email = serializer.validated_data["email"]
         password = serializer.validated_data["password"]
 
         # Try to authenticate with email as username
@@ -77,28 +161,16 @@ def login(request):
 
         if user:
             if user.is_active:
-                # Generate JWT tokens
-                refresh = RefreshToken.for_user(user)
-                access_token = str(refresh.access_token)
-                refresh_token = str(refresh)
-
-                # Prepare response data
-                user_data = UserSerializer(user).data
-                tokens = {"access": access_token, "refresh": refresh_token}
-
-                response_data = {
-                    "user": user_data,
-                    "tokens": tokens,
-                    "message": "Login successful!",
-                }
-
-                return Response(response_data, status=status.HTTP_200_OK)
+                return _build_auth_response(
+                    user, "Login successful!", status.HTTP_200_OK
+                )
             else:
                 return Response(
                     {"error": "Account is disabled. Please contact support."},
                     status=status.HTTP_400_BAD_REQUEST,
                 )
         else:
+            LoginEmailRateThrottle().record_failure(request)
             return Response(
                 {"error": "Invalid credentials. Please check your email and password."},
                 status=status.HTTP_401_UNAUTHORIZED,
@@ -122,8 +194,7 @@ def logout(request):
 
         if refresh_token:
             # Blacklist the refresh token
-            token = RefreshToken(refresh_token)
-            token.blacklist()
+            blacklist_refresh_token(refresh_token)
 
             return Response(
                 {"message": "Logout successful!"}, status=status.HTTP_200_OK
@@ -151,24 +222,45 @@ def profile(request):
     PUT/PATCH: Update user profile
     Requires: Authentication
     """
+    user = request.user
+
     if request.method == "GET":
-        serializer = UserProfileSerializer(request.user)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(_profile_dict(user), status=status.HTTP_200_OK)
 
-    elif request.method in ["PUT", "PATCH"]:
-        serializer = UserProfileSerializer(
-            request.user, data=request.data, partial=request.method == "PATCH"
-        )
+    elif request.method in _WRITE_METHODS:
+        partial = request.method == "PATCH"
+
+        # A partial update touching no writable field would be a no-op save;
+        # non-object bodies go to the serializer, which rejects them
+        if (
+            partial
+            and isinstance(request.data, Mapping)
+            and _PROFILE_WRITABLE_FIELDS.isdisjoint(request.data)
+        ):
+            return Response(_profile_dict(user), status=status.HTTP_200_OK)
+
+        serializer = UserProfileSerializer(user, data=request.data, partial=partial)
 
         if serializer.is_valid():
-            serializer.save()
+            try:
+                with transaction.atomic():
+                    serializer.save()
+            except IntegrityError:
+                # Another request claimed the email after validation
+                return Response(
+                    {"email": [EMAIL_TAKEN_MESSAGE]},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
             return Response(serializer.data, status=status.HTTP_200_OK)
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
 @api_view(["POST"])
+@authentication_classes([])
 @permission_classes([AllowAny])
+@parser_classes(_TOKEN_PARSER_CLASSES)
+@renderer_classes([ORJSONRenderer])
 def refresh_token(request):
     """
     Refresh JWT token endpoint
@@ -185,19 +277,9 @@ def refresh_token(request):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Verify and refresh the token
-        refresh = RefreshToken(refresh_token)
-
-        # Check if token is blacklisted
-        try:
-            refresh.check_blacklist()
-        except Exception:
-            return Response(
-                {"error": "Invalid refresh token."}, status=status.HTTP_401_UNAUTHORIZED
-            )
-
-        # Generate new access token
-        new_access_token = str(refresh.access_token)
+        # Verify the token (signature, expiry, type and blacklist membership)
+        # and generate a new access token from its claims
+        new_access_token = access_token_for_refresh(refresh_token)
 
         return Response(
             {"access": new_access_token, "message": "Token refreshed successfully!"},